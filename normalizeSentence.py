@@ -1,6 +1,17 @@
 import re
+import string
+import sys
 from collections import defaultdict, Counter
+from functools import lru_cache
 
+_NONALPHA = re.compile(r'[^a-zA-Z]')
+# Deletion table for every ASCII character that is not a letter
+_NONALPHA_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if c not in string.ascii_letters))
+# Normalized length from which letter histograms are built with str.count
+_COUNT_SCAN_MIN_LENGTH = 64
+
+@lru_cache(maxsize=100_000)
 def normalize_sentence(sentence):
     """
     Normalize a sentence by removing spaces, punctuation and converting to lowercase.
@@ -12,9 +23,13 @@ def normalize_sentence(sentence):
         str: Normalized sentence with only alphabetic characters
     """
     # Remove all non-alphabetic characters and convert to lowercase
-    normalized = re.sub(r'[^a-zA-Z]', '', sentence).lower()
+    # (plain ASCII input can skip the regex engine entirely)
+    if sentence.isascii():
+        return sentence.translate(_NONALPHA_TABLE).lower()
+    normalized = _NONALPHA.sub('', sentence).lower()
     return normalized
 
+@lru_cache(maxsize=100_000)
 def get_anagram_key_sorted(sentence):
     """
     Get anagram key using sorted characters approach.
@@ -28,6 +43,7 @@ def get_anagram_key_sorted(sentence):
     normalized = normalize_sentence(sentence)
     return ''.join(sorted(normalized))
 
+@lru_cache(maxsize=100_000)
 def get_anagram_key_frequency(sentence):
     """
     Get anagram key using character frequency counts.
@@ -36,11 +52,28 @@ def get_anagram_key_frequency(sentence):
         sentence (str): Input sentence
         
     Returns:
-        tuple: Sorted tuple of (char, count) pairs
+        int or tuple: Count of each letter 'a' through 'z', packed one byte
+            per letter into an int, or as a 26-tuple when the sentence is
+            too long for every count to fit in a byte
     """
     normalized = normalize_sentence(sentence)
-    char_count = Counter(normalized)
-    return tuple(sorted(char_count.items()))
+    counts = _letter_counts(normalized)
+    
+    # No count can exceed the sentence length, so short sentences always
+    # pack; a single int key hashes much faster than a 26-tuple
+    if len(normalized) < 256:
+        return int.from_bytes(bytes(counts), 'little')
+    return tuple(counts)
+
+def _letter_counts(normalized):
+    """Count each letter 'a' through 'z' in a normalized sentence."""
+    if len(normalized) >= _COUNT_SCAN_MIN_LENGTH:
+        # One C-level scan per letter beats a Python loop over long input
+        return tuple(map(normalized.count, string.ascii_lowercase))
+    counts = [0] * 26
+    for char in normalized:
+        counts[ord(char) - 97] += 1
+    return counts
 
 def group_anagrams_sorted(sentences):
     """
@@ -58,7 +91,7 @@ def group_anagrams_sorted(sentences):
         key = get_anagram_key_sorted(sentence)
         anagram_groups[key].append(sentence)
     
-    # Return only groups with more than one sentence
+    # Return only groups with more than one sentence, in first-appearance order
     result = [group for group in anagram_groups.values() if len(group) > 1]
     return result
 
@@ -78,7 +111,7 @@ def group_anagrams_frequency(sentences):
         key = get_anagram_key_frequency(sentence)
         anagram_groups[key].append(sentence)
     
-    # Return only groups with more than one sentence
+    # Return only groups with more than one sentence, in first-appearance order
     result = [group for group in anagram_groups.values() if len(group) > 1]
     return result
 
@@ -95,7 +128,9 @@ def group_all_anagrams(sentences):
     anagram_groups = defaultdict(list)
     
     for sentence in sentences:
-        key = get_anagram_key_sorted(sentence)
+        # Letter counts group exactly like sorted characters, without
+        # sorting or hashing a full-length key
+        key = get_anagram_key_frequency(sentence)
         anagram_groups[key].append(sentence)
     
     # Return all groups
@@ -115,7 +150,11 @@ def are_anagrams(sentence1, sentence2):
     norm1 = normalize_sentence(sentence1)
     norm2 = normalize_sentence(sentence2)
     
-    return sorted(norm1) == sorted(norm2)
+    # Different letter totals can never be anagrams; skip the counting
+    if len(norm1) != len(norm2):
+        return False
+    
+    return Counter(norm1) == Counter(norm2)
 
 def detailed_analysis(sentences):
     """
@@ -124,30 +163,34 @@ def detailed_analysis(sentences):
     Args:
         sentences (list): List of sentences to analyze
     """
-    print("DETAILED ANAGRAM ANALYSIS")
-    print("=" * 50)
+    out = ["DETAILED ANAGRAM ANALYSIS", "=" * 50]
     
-    print("\n1. Sentence Normalization:")
+    # Normalize and key every sentence once; later steps reuse the keys
+    out.append("\n1. Sentence Normalization:")
+    keys = []
     for i, sentence in enumerate(sentences, 1):
         normalized = normalize_sentence(sentence)
-        sorted_chars = get_anagram_key_sorted(sentence)
-        print(f"  {i}. '{sentence}'")
-        print(f"     Normalized: '{normalized}'")
-        print(f"     Sorted chars: '{sorted_chars}'")
+        sorted_chars = ''.join(sorted(normalized))
+        keys.append(sorted_chars)
+        out.append(f"  {i}. '{sentence}'")
+        out.append(f"     Normalized: '{normalized}'")
+        out.append(f"     Sorted chars: '{sorted_chars}'")
     
-    print("\n2. Anagram Key Mapping:")
+    out.append("\n2. Anagram Key Mapping:")
     key_to_sentences = defaultdict(list)
-    for sentence in sentences:
-        key = get_anagram_key_sorted(sentence)
+    for key, sentence in zip(keys, sentences):
         key_to_sentences[key].append(sentence)
     
     for key, group in key_to_sentences.items():
-        print(f"  Key '{key}': {group}")
+        out.append(f"  Key '{key}': {group}")
     
-    print("\n3. Final Groups (only groups with 2+ sentences):")
-    result = group_anagrams_sorted(sentences)
+    out.append("\n3. Final Groups (only groups with 2+ sentences):")
+    result = [group for group in key_to_sentences.values() if len(group) > 1]
     for i, group in enumerate(result, 1):
-        print(f"  Group {i}: {group}")
+        out.append(f"  Group {i}: {group}")
+    
+    # Emit the whole report with a single write
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def test_anagram_grouping():
     """Test the anagram grouping with the provided example"""
@@ -225,8 +268,8 @@ def run_comprehensive_tests():
     ]
     
     for i, test in enumerate(test_cases, 1):
-        print(f"\nTest Case {i}: {test['name']}")
-        print(f"Input: {test['input']}")
+        # Buffer each test case's report and write it out in one go
+        out = [f"\nTest Case {i}: {test['name']}", f"Input: {test['input']}"]
         
         result = group_anagrams_sorted(test['input'])
         
@@ -237,25 +280,29 @@ def run_comprehensive_tests():
         expected_norm = normalize_for_comparison(test['expected'])
         result_norm = normalize_for_comparison(result)
         
-        print(f"Result: {result}")
-        print(f"Expected: {test['expected']}")
-        print(f"Status: {'PASS' if result_norm == expected_norm else 'FAIL'}")
+        out.append(f"Result: {result}")
+        out.append(f"Expected: {test['expected']}")
+        out.append(f"Status: {'PASS' if result_norm == expected_norm else 'FAIL'}")
         
         # Show individual anagram verification for failed cases
         if result_norm != expected_norm and test['name'] != 'No anagrams':
-            print("  Anagram verification:")
+            out.append("  Anagram verification:")
             for sentence in test['input']:
                 norm = normalize_sentence(sentence)
                 key = get_anagram_key_sorted(sentence)
-                print(f"    '{sentence}' -> '{norm}' -> '{key}'")
+                out.append(f"    '{sentence}' -> '{norm}' -> '{key}'")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
+
+def _clear_key_caches():
+    """Empty the memoized normalization and anagram key caches"""
+    normalize_sentence.cache_clear()
+    get_anagram_key_sorted.cache_clear()
+    get_anagram_key_frequency.cache_clear()
 
 def performance_comparison():
     """Compare performance of different approaches"""
     
-    print("\n" + "=" * 50)
-    print("PERFORMANCE COMPARISON")
-    print("=" * 50)
-    
     import time
     
     # Create test data
@@ -265,21 +312,27 @@ def performance_comparison():
         'Astronomer', 'Moon starer', 'The earthquakes', 'That queer shake'
     ] * 100  # Multiply for performance testing
     
-    print(f"Testing with {len(test_sentences)} sentences...")
+    out = ["\n" + "=" * 50, "PERFORMANCE COMPARISON", "=" * 50,
+           f"Testing with {len(test_sentences)} sentences..."]
     
-    # Test sorted approach
-    start_time = time.time()
+    # Test sorted approach (each approach starts from cold caches, so
+    # neither is timed on the other's memoized normalization)
+    _clear_key_caches()
+    start_time = time.perf_counter()
     result_sorted = group_anagrams_sorted(test_sentences)
-    time_sorted = time.time() - start_time
+    time_sorted = time.perf_counter() - start_time
     
     # Test frequency approach
-    start_time = time.time()
+    _clear_key_caches()
+    start_time = time.perf_counter()
     result_frequency = group_anagrams_frequency(test_sentences)
-    time_frequency = time.time() - start_time
+    time_frequency = time.perf_counter() - start_time
     
-    print(f"Sorted approach time: {time_sorted:.4f} seconds")
-    print(f"Frequency approach time: {time_frequency:.4f} seconds")
-    print(f"Results match: {len(result_sorted) == len(result_frequency)}")
+    # Report only after both timings so output never lands inside a window
+    out.append(f"Sorted approach time: {time_sorted:.4f} seconds")
+    out.append(f"Frequency approach time: {time_frequency:.4f} seconds")
+    out.append(f"Results match: {len(result_sorted) == len(result_frequency)}")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     # Run main test
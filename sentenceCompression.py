@@ -1,5 +1,29 @@
 import re
-from collections import OrderedDict
+import sys
+from array import array
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+
+_NONWORD = re.compile(r'[^\w]')
+# Alternating runs of word characters and punctuation within one token
+_TOKEN_PARTS = re.compile(r'(\w*)([^\w\s]*)')
+# Deletion table for every ASCII character that \w does not match
+_NONWORD_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c == '_')))
+
+@lru_cache(maxsize=100_000)
+def _clean_word(word):
+    """Remove punctuation from a single token, keeping word characters."""
+    if word.isascii():
+        return word.translate(_NONWORD_TABLE)
+    return _NONWORD.sub('', word)
+
+@lru_cache(maxsize=100_000)
+def _split_token(word):
+    """Split a token into its word characters and its punctuation in one scan."""
+    word_chars, punctuation = zip(*_TOKEN_PARTS.findall(word))
+    return ''.join(word_chars), ''.join(punctuation)
 
 def compress_sentence(sentence):
     """
@@ -9,37 +33,20 @@ def compress_sentence(sentence):
         sentence (str): Input sentence to compress
         
     Returns:
-        tuple: (encoded_list, word_mapping_dict)
-            - encoded_list: List of integer IDs representing words
+        tuple: (encoded_array, word_mapping_dict)
+            - encoded_array: array('I') of integer IDs representing words
             - word_mapping_dict: Dictionary mapping IDs to original words
     """
-    # Split sentence into words (handle punctuation)
-    words = sentence.lower().split()
-    
-    # Clean words by removing punctuation
-    cleaned_words = []
-    for word in words:
-        # Remove punctuation but keep the word
-        cleaned_word = re.sub(r'[^\w]', '', word)
-        if cleaned_word:  # Only add non-empty words
-            cleaned_words.append(cleaned_word)
-    
-    # Create mapping and encoded sequence
     word_to_id = {}
-    id_to_word = {}
-    encoded = []
-    next_id = 1
     
-    for word in cleaned_words:
-        if word not in word_to_id:
-            # First occurrence - assign new ID
-            word_to_id[word] = next_id
-            id_to_word[next_id] = word
-            next_id += 1
-        
-        # Add ID to encoded sequence
-        encoded.append(word_to_id[word])
+    # Tokenize, clean and assign IDs in a single pass over the words. IDs
+    # follow first occurrence, so a new word's ID is the vocabulary size + 1;
+    # they are stored as unsigned ints rather than boxed Python ints
+    encoded = array('I', [word_to_id.setdefault(word, len(word_to_id) + 1)
+                          for word in map(_clean_word, sentence.lower().split()) if word])
     
+    # Dicts keep insertion order, so this is already ordered by ID
+    id_to_word = {word_id: word for word, word_id in word_to_id.items()}
     return encoded, id_to_word
 
 def compress_sentence_preserve_case(sentence):
@@ -51,42 +58,57 @@ def compress_sentence_preserve_case(sentence):
         
     Returns:
         tuple: (encoded_list, word_mapping_dict, case_info, punctuation_info)
+            - case_info / punctuation_info: Packed (buffer, offsets) pairs;
+              word i's string is buffer[offsets[i]:offsets[i + 1]] in UTF-8
     """
     words = sentence.split()
     
     word_to_id = {}
     id_to_word = {}
     encoded = []
-    case_info = []
-    punctuation_info = []
+    # Per-word strings share one byte buffer each instead of one str apiece
+    case_buf = bytearray()
+    case_offsets = array('I', [0])
+    punct_buf = bytearray()
+    punct_offsets = array('I', [0])
     next_id = 1
     
     for word in words:
-        # Extract punctuation
-        punctuation = re.findall(r'[^\w\s]', word)
-        clean_word = re.sub(r'[^\w]', '', word).lower()
+        # One regex scan yields both the cased word and its punctuation
+        original_case, punctuation = _split_token(word)
+        clean_word = original_case.lower()
         
         if clean_word:
-            # Store case information
-            original_case = re.sub(r'[^\w]', '', word)
-            
             if clean_word not in word_to_id:
                 word_to_id[clean_word] = next_id
                 id_to_word[next_id] = clean_word
                 next_id += 1
             
             encoded.append(word_to_id[clean_word])
-            case_info.append(original_case)
-            punctuation_info.append(''.join(punctuation))
+            case_buf += original_case.encode('utf-8')
+            case_offsets.append(len(case_buf))
+            punct_buf += punctuation.encode('utf-8')
+            punct_offsets.append(len(punct_buf))
     
+    case_info = (bytes(case_buf), case_offsets)
+    punctuation_info = (bytes(punct_buf), punct_offsets)
     return encoded, id_to_word, case_info, punctuation_info
 
+def _packed_item(packed, index):
+    """Return the string at index from a packed (buffer, offsets) pair."""
+    buf, offsets = packed
+    return buf[offsets[index]:offsets[index + 1]].decode('utf-8')
+
+def _unpack_strings(packed):
+    """Expand a packed (buffer, offsets) pair back into a list of strings."""
+    return [_packed_item(packed, i) for i in range(len(packed[1]) - 1)]
+
 def decompress_sentence(encoded, mapping):
     """
     Decompress an encoded sentence back to original text.
     
     Args:
-        encoded (list): List of integer IDs
+        encoded (array or list): Sequence of integer IDs
         mapping (dict): Dictionary mapping IDs to words
         
     Returns:
@@ -102,25 +124,28 @@ def decompress_sentence_with_case(encoded, mapping, case_info, punctuation_info)
     Args:
         encoded (list): List of integer IDs
         mapping (dict): Dictionary mapping IDs to words
-        case_info (list): Original case information
-        punctuation_info (list): Original punctuation information
+        case_info (tuple): Packed original case information
+        punctuation_info (tuple): Packed original punctuation information
         
     Returns:
         str: Decompressed sentence with original formatting
     """
+    case_count = len(case_info[1]) - 1
+    punct_count = len(punctuation_info[1]) - 1
+    
     words = []
     for i, id_num in enumerate(encoded):
         base_word = mapping[id_num]
         
         # Restore case
-        if i < len(case_info):
-            word = case_info[i]
+        if i < case_count:
+            word = _packed_item(case_info, i)
         else:
             word = base_word
         
         # Add punctuation
-        if i < len(punctuation_info) and punctuation_info[i]:
-            word += punctuation_info[i]
+        if i < punct_count:
+            word += _packed_item(punctuation_info, i)
         
         words.append(word)
     
@@ -132,7 +157,7 @@ def analyze_compression(sentence, encoded, mapping):
     
     Args:
         sentence (str): Original sentence
-        encoded (list): Encoded sequence
+        encoded (array or list): Encoded sequence
         mapping (dict): Word mapping
     """
     print("COMPRESSION ANALYSIS")
@@ -145,7 +170,7 @@ def analyze_compression(sentence, encoded, mapping):
     # Calculate compression ratio
     # Assuming each character = 1 byte, each integer = 4 bytes
     original_bytes = original_length
-    compressed_bytes = len(encoded) * 4 + sum(len(word) for word in mapping.values())
+    compressed_bytes = len(encoded) * 4 + sum(map(len, mapping.values()))
     compression_ratio = original_bytes / compressed_bytes if compressed_bytes > 0 else float('inf')
     
     print(f"Original sentence: '{sentence}'")
@@ -156,13 +181,10 @@ def analyze_compression(sentence, encoded, mapping):
     print(f"Space saved: {original_bytes - compressed_bytes} bytes")
     
     # Word frequency analysis
-    word_freq = {}
-    for word_id in encoded:
-        word = mapping[word_id]
-        word_freq[word] = word_freq.get(word, 0) + 1
+    word_freq = Counter(mapping[word_id] for word_id in encoded)
     
     print(f"\nWord frequencies:")
-    for word, freq in sorted(word_freq.items(), key=lambda x: x[1], reverse=True):
+    for word, freq in sorted(word_freq.items(), key=itemgetter(1), reverse=True):
         print(f"  '{word}': {freq} times")
 
 def batch_compress(sentences):
@@ -174,26 +196,17 @@ def batch_compress(sentences):
         
     Returns:
         tuple: (encoded_sentences, shared_mapping)
+            - encoded_sentences: List of array('I') ID sequences, one per sentence
     """
     word_to_id = {}
-    id_to_word = {}
-    next_id = 1
     encoded_sentences = []
     
     for sentence in sentences:
-        words = sentence.lower().split()
-        cleaned_words = [re.sub(r'[^\w]', '', word) for word in words if re.sub(r'[^\w]', '', word)]
-        
-        encoded = []
-        for word in cleaned_words:
-            if word not in word_to_id:
-                word_to_id[word] = next_id
-                id_to_word[next_id] = word
-                next_id += 1
-            encoded.append(word_to_id[word])
-        
+        encoded = array('I', [word_to_id.setdefault(word, len(word_to_id) + 1)
+                              for word in map(_clean_word, sentence.lower().split()) if word])
         encoded_sentences.append(encoded)
     
+    id_to_word = {word_id: word for word, word_id in word_to_id.items()}
     return encoded_sentences, id_to_word
 
 def test_sentence_compression():
@@ -214,11 +227,11 @@ def test_sentence_compression():
     # Test compression
     encoded, mapping = compress_sentence(sentence)
     
-    print(f"\nResult encoded: {encoded}")
+    print(f"\nResult encoded: {encoded.tolist()}")
     print(f"Result mapping: {mapping}")
     
     # Verify results
-    encoded_match = encoded == expected_encoded
+    encoded_match = encoded.tolist() == expected_encoded
     mapping_match = mapping == expected_mapping
     
     print(f"\nEncoded matches: {encoded_match}")
@@ -277,74 +290,76 @@ def run_comprehensive_tests():
     ]
     
     for i, test in enumerate(test_cases, 1):
-        print(f"\nTest Case {i}: {test['name']}")
-        print(f"Input: '{test['input']}'")
+        # Buffer each test case's report and write it out in one go
+        out = [f"\nTest Case {i}: {test['name']}", f"Input: '{test['input']}'"]
         
         encoded, mapping = compress_sentence(test['input'])
         
-        print(f"Result encoded: {encoded}")
-        print(f"Result mapping: {mapping}")
-        print(f"Expected encoded: {test['expected_encoded']}")
-        print(f"Expected mapping: {test['expected_mapping']}")
+        out.append(f"Result encoded: {encoded.tolist()}")
+        out.append(f"Result mapping: {mapping}")
+        out.append(f"Expected encoded: {test['expected_encoded']}")
+        out.append(f"Expected mapping: {test['expected_mapping']}")
         
-        encoded_match = encoded == test['expected_encoded']
+        encoded_match = encoded.tolist() == test['expected_encoded']
         mapping_match = mapping == test['expected_mapping']
         
-        print(f"Status: {'PASS' if encoded_match and mapping_match else 'FAIL'}")
+        out.append(f"Status: {'PASS' if encoded_match and mapping_match else 'FAIL'}")
         
         # Test round-trip compression/decompression
         decompressed = decompress_sentence(encoded, mapping)
-        original_cleaned = ' '.join([re.sub(r'[^\w]', '', word).lower() 
+        original_cleaned = ' '.join([_NONWORD.sub('', word).lower() 
                                    for word in test['input'].split() 
-                                   if re.sub(r'[^\w]', '', word)])
+                                   if _NONWORD.sub('', word)])
+        
+        out.append(f"Round-trip test: {'PASS' if decompressed == original_cleaned else 'FAIL'}")
         
-        print(f"Round-trip test: {'PASS' if decompressed == original_cleaned else 'FAIL'}")
+        sys.stdout.write('\n'.join(out) + '\n')
 
 def demonstrate_advanced_features():
     """Demonstrate advanced compression features"""
     
-    print("\n" + "=" * 50)
-    print("ADVANCED FEATURES DEMO")
-    print("=" * 50)
+    out = ["\n" + "=" * 50, "ADVANCED FEATURES DEMO", "=" * 50]
     
     # Case-preserving compression
-    print("\n1. Case-Preserving Compression:")
+    out.append("\n1. Case-Preserving Compression:")
     sentence = "The Quick Brown Fox jumps over THE lazy dog."
     encoded, mapping, case_info, punct_info = compress_sentence_preserve_case(sentence)
     
-    print(f"Original: '{sentence}'")
-    print(f"Encoded: {encoded}")
-    print(f"Mapping: {mapping}")
-    print(f"Case info: {case_info}")
-    print(f"Punctuation: {punct_info}")
+    out.append(f"Original: '{sentence}'")
+    out.append(f"Encoded: {encoded}")
+    out.append(f"Mapping: {mapping}")
+    out.append(f"Case info: {_unpack_strings(case_info)}")
+    out.append(f"Punctuation: {_unpack_strings(punct_info)}")
     
     restored = decompress_sentence_with_case(encoded, mapping, case_info, punct_info)
-    print(f"Restored: '{restored}'")
+    out.append(f"Restored: '{restored}'")
     
     # Batch compression
-    print("\n2. Batch Compression:")
+    out.append("\n2. Batch Compression:")
     sentences = [
         "the cat sat on the mat",
         "the dog ran in the park", 
         "a cat and a dog played together"
     ]
     
-    print("Input sentences:")
+    out.append("Input sentences:")
     for i, s in enumerate(sentences, 1):
-        print(f"  {i}. '{s}'")
+        out.append(f"  {i}. '{s}'")
     
     encoded_batch, shared_mapping = batch_compress(sentences)
     
-    print(f"\nShared mapping: {shared_mapping}")
-    print("Encoded sentences:")
+    out.append(f"\nShared mapping: {shared_mapping}")
+    out.append("Encoded sentences:")
     for i, encoded in enumerate(encoded_batch, 1):
-        print(f"  {i}. {encoded}")
+        out.append(f"  {i}. {encoded.tolist()}")
     
     # Show compression efficiency
-    print(f"\nVocabulary size: {len(shared_mapping)} unique words")
+    out.append(f"\nVocabulary size: {len(shared_mapping)} unique words")
     total_words = sum(len(encoded) for encoded in encoded_batch)
-    print(f"Total word instances: {total_words}")
-    print(f"Compression efficiency: {len(shared_mapping)/total_words:.2%} unique words")
+    out.append(f"Total word instances: {total_words}")
+    out.append(f"Compression efficiency: {len(shared_mapping)/total_words:.2%} unique words")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def interactive_compression_tool():
     """Interactive tool for sentence compression"""
@@ -368,7 +383,7 @@ def interactive_compression_tool():
         encoded, mapping = compress_sentence(sentence)
         decompressed = decompress_sentence(encoded, mapping)
         
-        print(f"  Encoded: {encoded}")
+        print(f"  Encoded: {encoded.tolist()}")
         print(f"  Mapping: {mapping}")
         print(f"  Decompressed: '{decompressed}'")
         print(f"  Vocabulary size: {len(mapping)}")
@@ -410,8 +425,8 @@ if __name__ == "__main__":
     
     # Verify large text compression
     decompressed_large = decompress_sentence(encoded_large, mapping_large)
-    original_cleaned = ' '.join([re.sub(r'[^\w]', '', word).lower() 
+    original_cleaned = ' '.join([_NONWORD.sub('', word).lower() 
                                 for word in large_text.split() 
-                                if re.sub(r'[^\w]', '', word)])
+                                if _NONWORD.sub('', word)])
     
     print(f"  Large text round-trip: {'SUCCESS' if decompressed_large == original_cleaned else 'FAILED'}")
\ No newline at end of file
@@ -1,6 +1,26 @@
 from collections import deque
+from operator import length_hint
 
-def simulate_snake(grid, start, directions, food):
+# Cell flags in simulate_snake's occupancy grid (food may lie under the
+# starting cell until the snake comes back to eat it)
+_SNAKE = 1
+_FOOD = 2
+
+# simulate_snake's flat occupancy grid costs a byte per cell up front, so it
+# is only used while the grid has at most this many cells per move or food
+# item (a set entry costs far more than a few bytes); larger, sparsely
+# visited boards use packed-int sets instead
+_FLAT_GRID_CELLS_PER_ITEM = 4
+
+# Direction mappings
+_DIR_MAP = {
+    'U': (-1, 0),  # Up: decrease row
+    'D': (1, 0),   # Down: increase row
+    'L': (0, -1),  # Left: decrease col
+    'R': (0, 1)    # Right: increase col
+}
+
+def simulate_snake(grid, start, directions, food, verbose=False):
     """
     Simulate a snake game in a grid based on given directions.
     
@@ -9,43 +29,148 @@ def simulate_snake(grid, start, directions, food):
         start (tuple): Starting position (row, col)
         directions (list): List of direction commands ['U', 'D', 'L', 'R']
         food (set): Set of food positions
+        verbose (bool): Print a trace of every step
     
     Returns:
         list: Final snake body coordinates or 'Game Over'
     """
+    if verbose:
+        return _simulate_snake_traced(grid, start, directions, food)
+    
+    rows, cols = grid
+    # Iterables without a length count as empty, which favours the sets
+    run_size = length_hint(directions) + length_hint(food) + 1
+    if rows * cols > _FLAT_GRID_CELLS_PER_ITEM * run_size:
+        return _simulate_snake_sparse(grid, start, directions, food)
+    
+    head_row, head_col = start
+    
+    # Cells are keyed as row * cols + col and their state lives in a flat
+    # occupancy grid, so each step's collision and food checks are a single
+    # bytearray read instead of set lookups. The extra last slot holds an
+    # off-grid start.
+    head = _start_key(grid, start)
+    cells = bytearray(rows * cols + 1)
+    
+    # Initialize snake with starting position
+    snake_body = deque([head])
+    cells[head] = _SNAKE
+    # Only food inside the grid can be eaten
+    for row, col in food:
+        if 0 <= row < rows and 0 <= col < cols:
+            cells[row * cols + col] |= _FOOD
+    
+    # Process each direction command. The commands are translated to deltas
+    # lazily at C level; an unknown command only raises KeyError if the game
+    # is still running when it is reached.
+    for delta_row, delta_col in map(_DIR_MAP.__getitem__, directions):
+        # Calculate new head position
+        head_row += delta_row
+        head_col += delta_col
+        
+        # Check wall collision (either coordinate negative makes the OR negative)
+        if (head_row | head_col) < 0 or head_row >= rows or head_col >= cols:
+            return "Game Over"
+        
+        # Check self collision
+        new_head = head_row * cols + head_col
+        cell = cells[new_head]
+        if cell & _SNAKE:
+            return "Game Over"
+        
+        # Move head to new position
+        snake_body.appendleft(new_head)
+        cells[new_head] = _SNAKE
+        
+        # Snake grows when it eats, otherwise the tail moves up
+        if not cell & _FOOD:
+            tail = snake_body.pop()
+            cells[tail] &= ~_SNAKE
+    
+    # Return final snake body as list
+    return _cells(snake_body, grid, start)
+
+
+def _simulate_snake_sparse(grid, start, directions, food):
+    """
+    simulate_snake for grids much larger than the run.
+    
+    Keeps the snake and the food as sets of packed row * cols + col keys,
+    so the cost follows the number of moves and food items rather than
+    the grid area.
+    """
+    rows, cols = grid
+    head_row, head_col = start
+    
+    # Initialize snake with starting position
+    head = _start_key(grid, start)
+    snake_body = deque([head])
+    snake_set = {head}
+    # Only food inside the grid can be eaten
+    food_set = {row * cols + col for row, col in food
+                if 0 <= row < rows and 0 <= col < cols}
+    
+    # Process each direction command
+    for delta_row, delta_col in map(_DIR_MAP.__getitem__, directions):
+        # Calculate new head position
+        head_row += delta_row
+        head_col += delta_col
+        
+        # Check wall collision (either coordinate negative makes the OR negative)
+        if (head_row | head_col) < 0 or head_row >= rows or head_col >= cols:
+            return "Game Over"
+        
+        # Check self collision
+        new_head = head_row * cols + head_col
+        if new_head in snake_set:
+            return "Game Over"
+        
+        # Move head to new position
+        snake_body.appendleft(new_head)
+        snake_set.add(new_head)
+        
+        # Snake grows when it eats, otherwise the tail moves up
+        if new_head in food_set:
+            food_set.remove(new_head)
+        else:
+            snake_set.remove(snake_body.pop())
+    
+    # Return final snake body as list
+    return _cells(snake_body, grid, start)
+
+
+def _simulate_snake_traced(grid, start, directions, food):
+    """
+    simulate_snake with a printed trace of every step.
+    
+    The trace prints the remaining food after every step, so the snake and
+    the food are kept as small sets of (row, col) positions; the cost of a
+    step follows the food count, never the grid area.
+    """
     rows, cols = grid
+    head_row, head_col = start
     
     # Initialize snake with starting position
     snake_body = deque([start])
-    snake_set = {start}  # For O(1) collision detection
+    snake_set = {start}
     food_set = set(food)  # Copy to avoid modifying original
     
-    # Direction mappings
-    direction_map = {
-        'U': (-1, 0),  # Up: decrease row
-        'D': (1, 0),   # Down: increase row
-        'L': (0, -1),  # Left: decrease col
-        'R': (0, 1)    # Right: increase col
-    }
-    
     print(f"Initial state: Snake at {start}, Food at {food_set}")
     
     # Process each direction command
-    for i, direction in enumerate(directions):
-        print(f"\nStep {i+1}: Moving {direction}")
-        
-        # Get current head position
-        head_row, head_col = snake_body[0]
+    for step, direction in enumerate(directions, 1):
+        print(f"\nStep {step}: Moving {direction}")
         
         # Calculate new head position
-        delta_row, delta_col = direction_map[direction]
-        new_head = (head_row + delta_row, head_col + delta_col)
-        new_row, new_col = new_head
+        delta_row, delta_col = _DIR_MAP[direction]
+        head_row += delta_row
+        head_col += delta_col
+        new_head = (head_row, head_col)
         
         print(f"  New head position: {new_head}")
         
         # Check wall collision
-        if new_row < 0 or new_row >= rows or new_col < 0 or new_col >= cols:
+        if (head_row | head_col) < 0 or head_row >= rows or head_col >= cols:
             print(f"  Game Over: Hit wall at {new_head}")
             return "Game Over"
         
@@ -78,26 +203,47 @@ def simulate_snake(grid, start, directions, food):
     return final_body
 
 
+def _start_key(grid, start):
+    """
+    Pack the starting position as row * cols + col.
+    
+    An off-grid start would alias a real cell, so it gets the spare key
+    rows * cols instead: just past every real cell, it never meets a head.
+    """
+    rows, cols = grid
+    row, col = start
+    if 0 <= row < rows and 0 <= col < cols:
+        return row * cols + col
+    return rows * cols
+
+
+def _cells(keys, grid, start):
+    """Decode packed row * cols + col keys back into (row, col) tuples"""
+    rows, cols = grid
+    off_grid = rows * cols
+    return [start if key == off_grid else divmod(key, cols) for key in keys]
+
+
 def visualize_grid(grid, snake_body, food_set, step_num=None):
     """Helper function to visualize the current game state"""
     rows, cols = grid
     
-    # Create empty grid
-    display_grid = [['.' for _ in range(cols)] for _ in range(rows)]
+    # Create empty grid as one flat byte buffer
+    display_grid = bytearray(b'.' * (rows * cols))
     
     # Place food
     for food_pos in food_set:
         row, col = food_pos
         if 0 <= row < rows and 0 <= col < cols:
-            display_grid[row][col] = 'F'
+            display_grid[row * cols + col] = ord('F')
     
     # Place snake body
     for i, (row, col) in enumerate(snake_body):
         if 0 <= row < rows and 0 <= col < cols:
             if i == 0:
-                display_grid[row][col] = 'H'  # Head
+                display_grid[row * cols + col] = ord('H')  # Head
             else:
-                display_grid[row][col] = 'B'  # Body
+                display_grid[row * cols + col] = ord('B')  # Body
     
     # Print grid
     if step_num is not None:
@@ -106,7 +252,8 @@ def visualize_grid(grid, snake_body, food_set, step_num=None):
         print("\nGrid state:")
     
     print("  " + " ".join(str(i) for i in range(cols)))
-    for i, row in enumerate(display_grid):
+    for i in range(rows):
+        row = display_grid[i * cols:(i + 1) * cols].decode('ascii')
         print(f"{i} " + " ".join(row))
     print("Legend: H=Head, B=Body, F=Food, .=Empty")
 
@@ -133,7 +280,7 @@ def test_snake_simulation():
     visualize_grid(grid, [start], food, 0)
     
     # Run simulation
-    result = simulate_snake(grid, start, directions, food)
+    result = simulate_snake(grid, start, directions, food, verbose=True)
     
     print(f"\nFinal result: {result}")
     
@@ -188,7 +335,7 @@ def run_additional_tests():
         print(f"Directions: {test['directions']}, Food: {test['food']}")
         
         result = simulate_snake(test['grid'], test['start'], 
-                              test['directions'], test['food'])
+                              test['directions'], test['food'], verbose=False)
         
         print(f"Result: {result}")
         print(f"Expected: {test['expected']}")
@@ -203,37 +350,35 @@ def step_by_step_simulation(grid, start, directions, food):
     print("="*60)
     
     rows, cols = grid
-    snake_body = deque([start])
-    snake_set = {start}
-    food_set = set(food)
-    
-    direction_map = {
-        'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1)
-    }
+    head_row, head_col = start
+    head = _start_key(grid, start)
+    snake_body = deque([head])
+    snake_set = {head}
+    food_set = {row * cols + col for row, col in food
+                if 0 <= row < rows and 0 <= col < cols}
     
     # Show initial state
-    visualize_grid(grid, list(snake_body), food_set, 0)
+    visualize_grid(grid, _cells(snake_body, grid, start), _cells(food_set, grid, start), 0)
     
     for i, direction in enumerate(directions, 1):
         print(f"\n{'='*30}")
         print(f"STEP {i}: Moving {direction}")
         print(f"{'='*30}")
         
-        head_row, head_col = snake_body[0]
-        delta_row, delta_col = direction_map[direction]
-        new_head = (head_row + delta_row, head_col + delta_col)
-        new_row, new_col = new_head
+        delta_row, delta_col = _DIR_MAP[direction]
+        head_row += delta_row
+        head_col += delta_col
         
         # Check collisions
-        if (new_row < 0 or new_row >= rows or 
-            new_col < 0 or new_col >= cols):
-            print(f"COLLISION: Hit wall at {new_head}")
-            visualize_grid(grid, list(snake_body), food_set)
+        if (head_row | head_col) < 0 or head_row >= rows or head_col >= cols:
+            print(f"COLLISION: Hit wall at {(head_row, head_col)}")
+            visualize_grid(grid, _cells(snake_body, grid, start), _cells(food_set, grid, start))
             return "Game Over"
         
+        new_head = head_row * cols + head_col
         if new_head in snake_set:
-            print(f"COLLISION: Hit self at {new_head}")
-            visualize_grid(grid, list(snake_body), food_set)
+            print(f"COLLISION: Hit self at {(head_row, head_col)}")
+            visualize_grid(grid, _cells(snake_body, grid, start), _cells(food_set, grid, start))
             return "Game Over"
         
         # Move snake
@@ -242,7 +387,7 @@ def step_by_step_simulation(grid, start, directions, food):
         
         ate_food = new_head in food_set
         if ate_food:
-            print(f"FOOD EATEN at {new_head}! Snake grows.")
+            print(f"FOOD EATEN at {(head_row, head_col)}! Snake grows.")
             food_set.remove(new_head)
         else:
             print("No food. Snake moves.")
@@ -250,9 +395,9 @@ def step_by_step_simulation(grid, start, directions, food):
             snake_set.remove(tail)
         
         # Show current state
-        visualize_grid(grid, list(snake_body), food_set, i)
+        visualize_grid(grid, _cells(snake_body, grid, start), _cells(food_set, grid, start), i)
     
-    final_body = list(snake_body)
+    final_body = _cells(snake_body, grid, start)
     print(f"\nFINAL RESULT: {final_body}")
     return final_body
 
@@ -1,3 +1,10 @@
+import heapq
+import sys
+from bisect import bisect_right
+
+# Lowest average for grades D, C, B and A
+_GRADE_BOUNDS = (60, 70, 80, 90)
+
 def calculate_average(scores):
     """
     Calculate the average of a list of scores.
@@ -24,17 +31,22 @@ def rank_students(students_dict):
         list: List of tuples (name, average) sorted by rank
     """
     # Calculate averages for each student
-    student_averages = []
-    for name, scores in students_dict.items():
-        average = calculate_average(scores)
-        student_averages.append((name, average))
+    averages = _student_averages(students_dict)
     
     # Sort by average (descending) then by name (ascending) for ties
     # Using negative average for descending sort, name for ascending alphabetical sort
-    ranked_students = sorted(student_averages, key=lambda x: (-x[1], x[0]))
+    ranked_students = sorted(averages.items(), key=_rank_key)
     
     return ranked_students
 
+def _student_averages(students_dict):
+    """Map each student name to their average score"""
+    return {name: calculate_average(scores) for name, scores in students_dict.items()}
+
+def _rank_key(item):
+    """Sort key for (name, average) pairs: highest average first, then by name"""
+    return (-item[1], item[0])
+
 def rank_students_detailed(students_dict):
     """
     Rank students with detailed breakdown of the ranking process.
@@ -45,28 +57,29 @@ def rank_students_detailed(students_dict):
     Returns:
         list: List of tuples (name, average) sorted by rank
     """
-    print("DETAILED RANKING PROCESS")
-    print("=" * 50)
+    # Collect the report and write it out once at the end
+    out = ["DETAILED RANKING PROCESS", "=" * 50]
     
-    print("\n1. Calculate Averages:")
+    out.append("\n1. Calculate Averages:")
     student_averages = []
     for name, scores in students_dict.items():
         average = calculate_average(scores)
         student_averages.append((name, average))
         total = sum(scores)
         count = len(scores)
-        print(f"  {name}: {scores} → {total}/{count} = {average}")
+        out.append(f"  {name}: {scores} → {total}/{count} = {average}")
     
-    print(f"\n2. Before Sorting: {student_averages}")
+    out.append(f"\n2. Before Sorting: {student_averages}")
     
     # Sort with detailed explanation
-    ranked_students = sorted(student_averages, key=lambda x: (-x[1], x[0]))
+    ranked_students = sorted(student_averages, key=_rank_key)
     
-    print(f"\n3. After Sorting: {ranked_students}")
-    print("   Sort key: (-average, name)")
-    print("   - Negative average for descending order (highest first)")
-    print("   - Name for ascending alphabetical order (ties)")
+    out.append(f"\n3. After Sorting: {ranked_students}")
+    out.append("   Sort key: (-average, name)")
+    out.append("   - Negative average for descending order (highest first)")
+    out.append("   - Name for ascending alphabetical order (ties)")
     
+    sys.stdout.write('\n'.join(out) + '\n')
     return ranked_students
 
 def display_ranking_table(ranked_students):
@@ -76,10 +89,8 @@ def display_ranking_table(ranked_students):
     Args:
         ranked_students (list): List of tuples (name, average)
     """
-    print("\nRANKING TABLE")
-    print("=" * 30)
-    print(f"{'Rank':<6} {'Name':<12} {'Average':<8}")
-    print("-" * 30)
+    out = ["\nRANKING TABLE", "=" * 30,
+           f"{'Rank':<6} {'Name':<12} {'Average':<8}", "-" * 30]
     
     current_rank = 1
     prev_average = None
@@ -89,8 +100,10 @@ def display_ranking_table(ranked_students):
         if prev_average is not None and average != prev_average:
             current_rank = i + 1
         
-        print(f"{current_rank:<6} {name:<12} {average:<8}")
+        out.append(f"{current_rank:<6} {name:<12} {average:<8}")
         prev_average = average
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def find_top_students(students_dict, top_n=3):
     """
@@ -103,8 +116,13 @@ def find_top_students(students_dict, top_n=3):
     Returns:
         list: Top N students as tuples (name, average)
     """
-    ranked = rank_students(students_dict)
-    return ranked[:top_n]
+    # Anything but a non-negative int (None, negative counts) keeps the
+    # slice semantics of ranked[:top_n] over the full ranking
+    if not isinstance(top_n, int) or top_n < 0:
+        return rank_students(students_dict)[:top_n]
+    
+    # A partial heap selection is enough, no need to sort the whole class
+    return heapq.nsmallest(top_n, _student_averages(students_dict).items(), key=_rank_key)
 
 def get_students_by_grade_range(students_dict, min_avg=0, max_avg=100):
     """
@@ -149,12 +167,12 @@ def analyze_class_performance(students_dict):
     print(f"Range: {highest_avg - lowest_avg}")
     print(f"Number of Students: {len(students_dict)}")
     
-    # Grade distribution
-    a_students = len([avg for avg in averages if avg >= 90])
-    b_students = len([avg for avg in averages if 80 <= avg < 90])
-    c_students = len([avg for avg in averages if 70 <= avg < 80])
-    d_students = len([avg for avg in averages if 60 <= avg < 70])
-    f_students = len([avg for avg in averages if avg < 60])
+    # Grade distribution in one pass: bisecting the lower grade bounds gives
+    # the bucket index directly (0=F, 1=D, 2=C, 3=B, 4=A)
+    grade_counts = [0] * 5
+    for avg in averages:
+        grade_counts[bisect_right(_GRADE_BOUNDS, avg)] += 1
+    f_students, d_students, c_students, b_students, a_students = grade_counts
     
     print(f"\nGrade Distribution:")
     print(f"  A (90-100): {a_students} students")
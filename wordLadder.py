@@ -1,4 +1,9 @@
-from collections import deque
+from collections import defaultdict
+from functools import lru_cache
+
+# Marks for which search of word_ladder's bidirectional BFS reached a word
+_START_SIDE = 1
+_END_SIDE = 2
 
 def word_ladder(start, end, dictionary):
     """
@@ -8,7 +13,9 @@ def word_ladder(start, end, dictionary):
     Args:
         start (str): Starting word
         end (str): Target word
-        dictionary (set): Set of valid intermediate words
+        dictionary (set): Set of valid intermediate words. Pass a frozenset
+            to reuse its word index across calls; any other collection is
+            indexed again on every call.
     
     Returns:
         list: Shortest transformation sequence, or empty list if no path exists
@@ -17,42 +24,144 @@ def word_ladder(start, end, dictionary):
     if start == end:
         return [start]
     
+    # Only other iterables need copying for fast membership tests; a set is
+    # read as-is and never modified
+    if not isinstance(dictionary, (set, frozenset)):
+        dictionary = set(dictionary)
+    
     if end not in dictionary:
         return []
     
-    # Add start word to dictionary for processing
-    dictionary = set(dictionary)
-    dictionary.add(start)
+    # Words of another length can never appear on the ladder
+    if len(end) != len(start):
+        return []
+    
+    # The start word takes part in the search even when it is not a
+    # dictionary word
+    extra_word = None if start in dictionary else start
+    # Only a frozenset can key the cached index; freezing a mutable set here
+    # would copy and hash the whole dictionary on every call
+    if isinstance(dictionary, frozenset):
+        build_index = _ladder_index
+    else:
+        build_index = _ladder_index.__wrapped__
+    words, word_ids, word_buckets = build_index(dictionary, len(start), extra_word)
+    
+    # Bidirectional BFS: one search grows from start, the other from end.
+    # Each word records the parent it was reached from, and the path is
+    # rebuilt once the two searches meet.
+    start_id = word_ids[start]
+    end_id = word_ids[end]
+    # seen marks, by word id, which search reached a word (0 = neither),
+    # so one read tells an unvisited word from a meeting point
+    seen = bytearray(len(words))
+    parent = [-1] * len(words)
+    seen[start_id] = _START_SIDE
+    seen[end_id] = _END_SIDE
+    start_frontier = [start_id]
+    end_frontier = [end_id]
     
-    # BFS setup
-    queue = deque([(start, [start])])  # (current_word, path_to_current_word)
-    visited = {start}
+    # Words sharing a pattern bucket with an endpoint are one step from it,
+    # so expanding one of them from the other side finishes the ladder
+    # without scanning its buckets
+    near_start = {word_id for bucket in word_buckets[start_id] for word_id in bucket}
+    near_end = {word_id for bucket in word_buckets[end_id] for word_id in bucket}
     
-    while queue:
-        current_word, path = queue.popleft()
+    while start_frontier and end_frontier:
+        # Always advance the smaller frontier by one full level
+        from_start = len(start_frontier) <= len(end_frontier)
+        if from_start:
+            frontier, side, near_target = start_frontier, _START_SIDE, near_end
+        else:
+            frontier, side, near_target = end_frontier, _END_SIDE, near_start
+        
+        next_frontier = []
+        for word_id in frontier:
+            if word_id in near_target:
+                if from_start:
+                    return _join_paths(word_id, end_id, parent, words)
+                return _join_paths(start_id, word_id, parent, words)
+            
+            # Words sharing a wildcard pattern differ by exactly one letter
+            for bucket in word_buckets[word_id]:
+                for next_id in bucket:
+                    mark = seen[next_id]
+                    
+                    # If not visited, add to this side's frontier
+                    if not mark:
+                        seen[next_id] = side
+                        parent[next_id] = word_id
+                        next_frontier.append(next_id)
+                    
+                    # Check if the two searches met
+                    elif mark != side:
+                        if from_start:
+                            return _join_paths(word_id, next_id, parent, words)
+                        return _join_paths(next_id, word_id, parent, words)
         
-        # Generate all possible one-letter variations
-        for i in range(len(current_word)):
-            for c in 'abcdefghijklmnopqrstuvwxyz':
-                if c == current_word[i]:
-                    continue
-                
-                # Create new word by changing one letter
-                new_word = current_word[:i] + c + current_word[i+1:]
-                
-                # Check if we reached the target
-                if new_word == end:
-                    return path + [new_word]
-                
-                # If valid word and not visited, add to queue
-                if new_word in dictionary and new_word not in visited:
-                    visited.add(new_word)
-                    queue.append((new_word, path + [new_word]))
+        if from_start:
+            start_frontier = next_frontier
+        else:
+            end_frontier = next_frontier
     
     # No transformation sequence found
     return []
 
 
+@lru_cache(maxsize=8)
+def _ladder_index(dictionary, word_length, extra_word):
+    """
+    Number the candidate words and index them by wildcard pattern, so the
+    search itself only touches small ints and never hashes a string.
+    
+    The index is cached across calls for frozenset dictionaries and shared
+    between them, so the returned structures must not be modified.
+    
+    Returns:
+        tuple: (words, word_ids, word_buckets)
+    """
+    words = [word for word in dictionary if len(word) == word_length]
+    if extra_word is not None:
+        words.append(extra_word)
+    words.sort()
+    word_ids = {word: word_id for word_id, word in enumerate(words)}
+    return tuple(words), word_ids, _build_patterns(words)
+
+
+def _build_patterns(words):
+    """
+    Group word ids by wildcard pattern (e.g. 'h*t' -> ids of hat, hit, hot).
+    
+    Returns a list holding, for each word id, the id buckets of its patterns.
+    """
+    patterns = defaultdict(list)
+    word_buckets = []
+    for word_id, word in enumerate(words):
+        buckets = []
+        for i in range(len(word)):
+            bucket = patterns[word[:i] + '*' + word[i+1:]]
+            bucket.append(word_id)
+            buckets.append(bucket)
+        word_buckets.append(buckets)
+    return word_buckets
+
+
+def _join_paths(start_side_id, end_side_id, parent, words):
+    """Splice the two half-paths of a bidirectional search into one ladder"""
+    path = []
+    word_id = start_side_id
+    while word_id != -1:
+        path.append(words[word_id])
+        word_id = parent[word_id]
+    path.reverse()
+    
+    word_id = end_side_id
+    while word_id != -1:
+        path.append(words[word_id])
+        word_id = parent[word_id]
+    return path
+
+
 def is_one_letter_different(word1, word2):
     """Helper function to check if two words differ by exactly one letter"""
     if len(word1) != len(word2):